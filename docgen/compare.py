@@ -7,12 +7,12 @@ from typing import List, Tuple, Union
 
 from docx import Document
 
-@dataclass
+@dataclass(slots=True)
 class ParaRep:
     style: str
     text: str
 
-@dataclass
+@dataclass(slots=True)
 class TableRep:
     style: str
     rows: List[List[str]]  # includes header row
@@ -47,6 +47,10 @@ def _flatten_docx(docx_path: Path) -> List[ElementRep]:
 def compare_docx_text(baseline_docx: Path, generated_docx: Path, max_mismatches: int = 80) -> str:
     base = _flatten_docx(baseline_docx)
     gen = _flatten_docx(generated_docx)
+    base_paras = sum(isinstance(x, ParaRep) for x in base)
+    base_tables = len(base) - base_paras
+    gen_paras = sum(isinstance(x, ParaRep) for x in gen)
+    gen_tables = len(gen) - gen_paras
 
     lines: List[str] = []
     lines.append("# DOCX similarity report")
@@ -57,8 +61,8 @@ def compare_docx_text(baseline_docx: Path, generated_docx: Path, max_mismatches:
     lines.append("## Structural counts")
     lines.append("")
     lines.append(f"- Elements (paragraphs+tables): baseline **{len(base)}**, generated **{len(gen)}**")
-    lines.append(f"- Paragraphs: baseline **{sum(isinstance(x, ParaRep) for x in base)}**, generated **{sum(isinstance(x, ParaRep) for x in gen)}**")
-    lines.append(f"- Tables: baseline **{sum(isinstance(x, TableRep) for x in base)}**, generated **{sum(isinstance(x, TableRep) for x in gen)}**")
+    lines.append(f"- Paragraphs: baseline **{base_paras}**, generated **{gen_paras}**")
+    lines.append(f"- Tables: baseline **{base_tables}**, generated **{gen_tables}**")
     lines.append("")
 
     # Compare sequence element-wise up to min length
@@ -3,7 +3,7 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from docx import Document
 from docx.enum.text import WD_BREAK, WD_PARAGRAPH_ALIGNMENT
@@ -11,16 +11,19 @@ from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
 from docx.shared import Pt
 
-from .validate import validate_table
-from .util import load_yaml
+from .validate import validate_table_data
+from .util import load_json, load_yaml
 
 TABLE_RE = re.compile(r"^\{\{TABLE:\s*(table-\d{2})\s*\}\}$")
 FMT_RE = re.compile(r"^<!--\s*fmt:\s*(.*?)\s*-->$")
 STYLE_RE = re.compile(r"^<!--\s*style:\s*(.+?)\s*-->$")  # legacy
 BLANK_RE = re.compile(r"^\{\{BLANK\}\}$")
 PAGE_BREAK_RE = re.compile(r"^\{\{PAGE_BREAK\}\}$")
+DIRECTIVE_PREFIXES = ("<!--", "{{")
+# key=value where value is "..." or unquoted up to whitespace
+FMT_KV_RE = re.compile(r'(\w+)=(?:"((?:\\.|[^"])*)"|([^\s]+))')
 
-@dataclass
+@dataclass(slots=True)
 class Block:
     kind: str  # "heading" | "para" | "table" | "empty" | "page_break"
     text: str = ""
@@ -66,12 +69,21 @@ def _apply_paragraph_format(paragraph, fmt: Dict[str, object]) -> None:
     bold = fmt.get("bold")
     italic = fmt.get("italic")
 
+    # Coerce once, not per run
+    font_size = Pt(float(size)) if isinstance(size, (int, float)) else None
+    if not isinstance(bold, bool):
+        bold = None
+    if not isinstance(italic, bool):
+        italic = None
+    if font_size is None and bold is None and italic is None:
+        return
+
     for run in paragraph.runs:
-        if isinstance(size, (int, float)):
-            run.font.size = Pt(float(size))
-        if isinstance(bold, bool):
+        if font_size is not None:
+            run.font.size = font_size
+        if bold is not None:
             run.bold = bold
-        if isinstance(italic, bool):
+        if italic is not None:
             run.italic = italic
 
 def _set_cell_text(cell, text: str) -> None:
@@ -102,9 +114,7 @@ def _parse_fmt_kv(s: str) -> Dict[str, object]:
     """
     out: Dict[str, object] = {}
 
-    # Tokenize: key=value where value is "..." or unquoted up to whitespace
-    token_re = re.compile(r'(\w+)=(?:"((?:\\.|[^"])*)"|([^\s]+))')
-    for m in token_re.finditer(s):
+    for m in FMT_KV_RE.finditer(s):
         key = m.group(1)
         if m.group(2) is not None:
             val = m.group(2).replace('\\"', '"')
@@ -160,45 +170,48 @@ def parse_narrative(md_path: Path) -> List[Block]:
 
     for raw in lines:
         line = raw.rstrip("\n")
+        stripped = line.strip()
 
         # Blank line = paragraph boundary (multiple blanks do NOT create empty paras; use {{BLANK}} for that)
-        if line.strip() == "":
+        if stripped == "":
             flush_para()
             continue
 
-        # Formatting directive
-        m = FMT_RE.match(line.strip())
-        if m and not para_lines:
-            pending_fmt.update(_parse_fmt_kv(m.group(1)))
-            continue
+        # Directives and markers all start with '<!--' or '{{'; plain text lines skip the regexes
+        if stripped.startswith(DIRECTIVE_PREFIXES):
+            # Formatting directive
+            m = FMT_RE.match(stripped)
+            if m and not para_lines:
+                pending_fmt.update(_parse_fmt_kv(m.group(1)))
+                continue
 
-        # Legacy style directive
-        m = STYLE_RE.match(line.strip())
-        if m and not para_lines:
-            pending_fmt["style"] = m.group(1).strip()
-            continue
+            # Legacy style directive
+            m = STYLE_RE.match(stripped)
+            if m and not para_lines:
+                pending_fmt["style"] = m.group(1).strip()
+                continue
 
-        # Explicit empty paragraph marker
-        if BLANK_RE.match(line.strip()):
-            flush_para()
-            blocks.append(Block(kind="empty"))
-            pending_fmt = {}
-            continue
+            # Explicit empty paragraph marker
+            if BLANK_RE.match(stripped):
+                flush_para()
+                blocks.append(Block(kind="empty"))
+                pending_fmt = {}
+                continue
 
-        # Explicit page break marker
-        if PAGE_BREAK_RE.match(line.strip()):
-            flush_para()
-            blocks.append(Block(kind="page_break"))
-            pending_fmt = {}
-            continue
+            # Explicit page break marker
+            if PAGE_BREAK_RE.match(stripped):
+                flush_para()
+                blocks.append(Block(kind="page_break"))
+                pending_fmt = {}
+                continue
 
-        # Table placeholder
-        m = TABLE_RE.match(line.strip())
-        if m:
-            flush_para()
-            blocks.append(Block(kind="table", table_id=m.group(1)))
-            pending_fmt = {}
-            continue
+            # Table placeholder
+            m = TABLE_RE.match(stripped)
+            if m:
+                flush_para()
+                blocks.append(Block(kind="table", table_id=m.group(1)))
+                pending_fmt = {}
+                continue
 
         # Heading
         if line.startswith("#"):
@@ -224,8 +237,15 @@ def build_docx(
     tables_dir: Path,
     schemas_dir: Path,
     out_docx: Path,
+    validate_tables: bool = True,
 ) -> None:
-    common_schema = schemas_dir / "table_common.schema.json"
+    """
+    Build the DOCX from the narrative markdown and table YAML files.
+
+    Tables are validated against their schemas as they are inserted unless
+    `validate_tables` is False (e.g. the caller already ran validate_all_tables).
+    """
+    common_schema: Optional[Dict[str, Any]] = None  # loaded on the first table that needs it
 
     doc = Document(str(template_docx))
     _clear_document_body(doc)
@@ -266,8 +286,11 @@ def build_docx(
             if not spath.exists():
                 raise FileNotFoundError(f"Missing table schema: {spath}")
 
-            validate_table(ypath, spath, common_schema)
             table_data = load_yaml(ypath)
+            if validate_tables:
+                if common_schema is None:
+                    common_schema = load_json(schemas_dir / "table_common.schema.json")
+                validate_table_data(table_data, spath, common_schema)
 
             columns = table_data["columns"]
             rows = table_data["rows"]
@@ -277,23 +300,25 @@ def build_docx(
             tbl.style = style_name
 
             # Header row
-            header_row = tbl.rows[0]
+            table_rows = list(tbl.rows)  # Table.rows[i] rebuilds the whole row list per access
+            header_row = table_rows[0]
             _set_repeat_table_header(header_row)
+            header_cells = header_row.cells
             for c_idx, col in enumerate(columns):
-                cell = header_row.cells[c_idx]
+                cell = header_cells[c_idx]
                 _set_cell_text(cell, str(col["title"]))
                 # Bold header
                 for para in cell.paragraphs:
                     for run in para.runs:
                         run.bold = True
 
-            # Data rows
-            for r_idx, row_obj in enumerate(rows, start=1):
-                tr = tbl.rows[r_idx]
-                for c_idx, col in enumerate(columns):
-                    key = col["key"]
+            # Data rows (Row.cells rebuilds the cell list on every access, so fetch it once per row)
+            keys = [col["key"] for col in columns]
+            for row_obj, tr in zip(rows, table_rows[1:]):
+                cells = tr.cells
+                for c_idx, key in enumerate(keys):
                     txt = row_obj.get(key, "")
-                    _set_cell_text(tr.cells[c_idx], str(txt))
+                    _set_cell_text(cells[c_idx], str(txt))
 
         else:
             raise ValueError(f"Unknown block kind: {b.kind}")
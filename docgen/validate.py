@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List, Optional
 
 from jsonschema import Draft202012Validator, RefResolver
 
@@ -11,9 +11,16 @@ class ValidationError(Exception):
     pass
 
 def validate_table(table_yaml: Path, schema_json: Path, common_schema_json: Path) -> None:
-    instance = load_yaml(table_yaml)
+    validate_table_data(load_yaml(table_yaml), schema_json, load_json(common_schema_json))
+
+def validate_table_data(instance: Dict[str, Any], schema_json: Path, common: Dict[str, Any]) -> None:
+    """
+    Validate already-loaded table data against its schema.
+
+    `common` is the parsed table_common schema, so callers validating many tables
+    can load it once and share it.
+    """
     schema = load_json(schema_json)
-    common = load_json(common_schema_json)
 
     store = {
         # allow refs by filename (as used in our generated schemas)
@@ -34,13 +41,23 @@ def validate_all_tables(src_tables_dir: Path, src_schemas_dir: Path) -> None:
         raise FileNotFoundError(f"No table YAML files found in {src_tables_dir}")
 
     errors: List[str] = []
+    common: Optional[Dict[str, Any]] = None
+    try:
+        common = load_json(common_schema)
+    except Exception as e:
+        # Still run the per-table missing-schema checks; only schema validation needs `common`
+        errors.append(f"{common_schema.name}: {e}")
+
+    schema_names = {p.name for p in src_schemas_dir.glob("table-*.schema.json")}
     for y in yamls:
         schema = src_schemas_dir / f"{y.stem}.schema.json"
-        if not schema.exists():
+        if schema.name not in schema_names:
             errors.append(f"Missing schema for {y.name}: expected {schema.name}")
             continue
+        if common is None:
+            continue
         try:
-            validate_table(y, schema, common_schema)
+            validate_table_data(load_yaml(y), schema, common)
         except Exception as e:
             errors.append(f"{y.name}: {e}")
 
@@ -34,6 +34,11 @@ from docgen.compare import compare_docx_text
 from docgen.render import render_docx_to_pngs
 
 ROOT = Path(__file__).resolve().parent
+SRC_TABLES_DIR = ROOT / "src" / "tables"
+SRC_SCHEMAS_DIR = ROOT / "src" / "schemas"
+NARRATIVE_MD = ROOT / "src" / "iso26262_rust_mapping.md"
+TEMPLATE_DOCX = ROOT / "templates" / "base.docx"
+BASELINE_DOCX = ROOT / "ref" / "baseline_enriched.docx"
 OUT_DOCX = ROOT / "build" / "docx" / "iso26262_rust_mapping_generated.docx"
 COMPARE_REPORT = ROOT / "build" / "reports" / "compare_report.md"
 RENDER_COMPARE_DIR = ROOT / "build" / "render_compare"
@@ -45,22 +50,22 @@ def _missing_render_tools() -> list[str]:
 
 def cmd_validate(_: argparse.Namespace) -> None:
     validate_all_tables(
-        src_tables_dir=ROOT / "src" / "tables",
-        src_schemas_dir=ROOT / "src" / "schemas",
+        src_tables_dir=SRC_TABLES_DIR,
+        src_schemas_dir=SRC_SCHEMAS_DIR,
     )
 
 def cmd_build(_: argparse.Namespace) -> None:
-    OUT_DOCX.parent.mkdir(parents=True, exist_ok=True)
     validate_all_tables(
-        src_tables_dir=ROOT / "src" / "tables",
-        src_schemas_dir=ROOT / "src" / "schemas",
+        src_tables_dir=SRC_TABLES_DIR,
+        src_schemas_dir=SRC_SCHEMAS_DIR,
     )
     build_docx(
-        template_docx=ROOT / "templates" / "base.docx",
-        narrative_md=ROOT / "src" / "iso26262_rust_mapping.md",
-        tables_dir=ROOT / "src" / "tables",
-        schemas_dir=ROOT / "src" / "schemas",
+        template_docx=TEMPLATE_DOCX,
+        narrative_md=NARRATIVE_MD,
+        tables_dir=SRC_TABLES_DIR,
+        schemas_dir=SRC_SCHEMAS_DIR,
         out_docx=OUT_DOCX,
+        validate_tables=False,  # already validated above
     )
     print(f"Wrote: {OUT_DOCX}")
 
@@ -68,7 +73,7 @@ def cmd_verify(args: argparse.Namespace) -> None:
     # Build
     cmd_build(args)
 
-    baseline = ROOT / "ref" / "baseline_enriched.docx"
+    baseline = BASELINE_DOCX
     generated = OUT_DOCX
 
     # Compare (text + table content)
@@ -88,7 +93,6 @@ def cmd_verify(args: argparse.Namespace) -> None:
                 "(Ubuntu/Debian: `sudo apt-get install -y libreoffice-writer poppler-utils`) "
                 "or run `uv run python make.py verify --render-pages 0` to skip rendering."
             )
-        RENDER_COMPARE_DIR.mkdir(parents=True, exist_ok=True)
         render_docx_to_pngs(baseline, RENDER_COMPARE_DIR / "baseline", max_pages=args.render_pages)
         render_docx_to_pngs(generated, RENDER_COMPARE_DIR / "generated", max_pages=args.render_pages)
         print(f"Wrote renders to: {RENDER_COMPARE_DIR}")